@@ -5,7 +5,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import (
-    accuracy_score, classification_report,
+    classification_report,
     confusion_matrix, roc_auc_score
 )
 import plotly.express as px
@@ -13,49 +13,95 @@ import plotly.express as px
 # ----------------------------
 # Load Data
 # ----------------------------
-df = pd.read_csv("WA_Fn-UseC_-HR-Employee-Attrition.csv")
+# Useless columns (constant across every employee)
+UNUSED_COLUMNS = {'EmployeeCount', 'Over18', 'StandardHours'}
 
-# Encode target
-df['Attrition'] = df['Attrition'].map({'Yes': 1, 'No': 0})
-df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
 
-# Drop useless columns
-df = df.drop(['EmployeeCount', 'Over18', 'StandardHours'], axis=1)
+@st.cache_data
+def load_data(path):
+    # Skip the constant columns while parsing instead of dropping them after
+    df = pd.read_csv(path, usecols=lambda c: c not in UNUSED_COLUMNS)
 
-# One-hot encoding
-df = pd.get_dummies(df, drop_first=True)
+    # Encode target
+    df['Attrition'] = df['Attrition'].map({'Yes': 1, 'No': 0})
+    df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
 
-# Split
-X = df.drop('Attrition', axis=1)
-y = df['Attrition']
+    # One-hot encoding
+    df = pd.get_dummies(df, drop_first=True)
+    return df
 
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X_scaled, y, test_size=0.2, random_state=42
-)
+df = load_data("WA_Fn-UseC_-HR-Employee-Attrition.csv")
 
 # ----------------------------
 # Model
 # ----------------------------
-model = RandomForestClassifier(
-    class_weight='balanced',
-    random_state=42,
-    n_estimators=200
-)
-model.fit(X_train, y_train)
+@st.cache_resource
+def train_model(df):
+    # Split
+    X = df.drop('Attrition', axis=1)
+    y = df['Attrition']
+
+    scaler = StandardScaler()
+    # The forest works in float32 internally; cast once here so the
+    # split and the fit/predict input checks don't copy the matrix again
+    X_scaled = scaler.fit_transform(X).astype(np.float32)
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_scaled, y, test_size=0.2, random_state=42
+    )
+
+    model = RandomForestClassifier(
+        class_weight='balanced',
+        random_state=42,
+        n_estimators=200
+    )
+    model.fit(X_train, y_train)
+    return X.columns.tolist(), scaler, model, X_test, y_test
+
 
 # ----------------------------
 # Evaluation
 # ----------------------------
-y_pred = model.predict(X_test)
-y_proba = model.predict_proba(X_test)[:, 1]
+@st.cache_data
+def evaluate_model(_model, X_test, y_test):
+    # One forest pass: predict() is argmax over predict_proba()
+    proba = _model.predict_proba(X_test)
+    y_pred = _model.classes_.take(np.argmax(proba, axis=1))
+    y_proba = proba[:, 1]
+
+    cm = confusion_matrix(y_test, y_pred)
+    # Accuracy is the diagonal of the confusion matrix; no extra scan needed
+    acc = np.trace(cm) / cm.sum()
+    auc = roc_auc_score(y_test, y_proba)
+    report = classification_report(y_test, y_pred, output_dict=False)
+    return acc, auc, report, cm
+
+
+feature_columns, scaler, model, X_test, y_test = train_model(df)
+acc, auc, report, cm = evaluate_model(model, X_test, y_test)
+
+# ----------------------------
+# Charts
+# ----------------------------
+@st.cache_resource
+def build_attrition_chart(df):
+    # Count server-side so only two bars are sent to the browser,
+    # not every row of the Attrition column
+    attrition_counts = df['Attrition'].value_counts().sort_index().reset_index()
+    return px.bar(attrition_counts, x="Attrition", y="count", title="Attrition Distribution")
+
+
+@st.cache_resource
+def build_importance_chart(_model, feature_columns):
+    importance = _model.feature_importances_
+    feat_df = pd.DataFrame({
+        'Feature': feature_columns,
+        'Importance': importance
+    }).sort_values(by="Importance", ascending=False).head(10)
+
+    return px.bar(feat_df, x="Importance", y="Feature", orientation='h')
 
-acc = accuracy_score(y_test, y_pred)
-auc = roc_auc_score(y_test, y_proba)
-report = classification_report(y_test, y_pred, output_dict=False)
-cm = confusion_matrix(y_test, y_pred)
 
 # ----------------------------
 # UI
@@ -84,7 +130,7 @@ with st.expander("Detailed metrics"):
 # ----------------------------
 st.subheader("📈 Attrition Insights")
 
-fig1 = px.histogram(df, x="Attrition", title="Attrition Distribution")
+fig1 = build_attrition_chart(df)
 st.plotly_chart(fig1)
 
 # ----------------------------
@@ -108,7 +154,7 @@ input_data = pd.DataFrame({
 })
 
 # Align columns
-input_data = input_data.reindex(columns=X.columns, fill_value=0)
+input_data = input_data.reindex(columns=feature_columns, fill_value=0)
 
 input_scaled = scaler.transform(input_data)
 
@@ -116,8 +162,9 @@ input_scaled = scaler.transform(input_data)
 # PREDICTION
 # ----------------------------
 if st.button("Predict Attrition Risk"):
-    prediction = model.predict(input_scaled)[0]
-    prob = model.predict_proba(input_scaled)[0][1]
+    proba = model.predict_proba(input_scaled)[0]
+    prediction = model.classes_[np.argmax(proba)]
+    prob = proba[1]
 
     if prediction == 1:
         st.error(f"⚠️ High Risk of Attrition ({prob:.2f})")
@@ -126,11 +173,5 @@ if st.button("Predict Attrition Risk"):
 
     st.subheader("📊 Feature Importance")
 
-    importance = model.feature_importances_
-    feat_df = pd.DataFrame({
-        'Feature': X.columns,
-        'Importance': importance
-    }).sort_values(by="Importance", ascending=False).head(10)
-
-    fig2 = px.bar(feat_df, x="Importance", y="Feature", orientation='h')
+    fig2 = build_importance_chart(model, feature_columns)
     st.plotly_chart(fig2)